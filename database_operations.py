@@ -12,169 +12,589 @@ DEV 128 Fall 2025 Section 27802
 https://github.com/rlr524/dev-128-prog-project-2
 """
 
+import contextlib
+import functools
+import itertools
+import os
+import shutil
 import sqlite3
+from typing import NamedTuple
 
 # Database filename - stored at module level for easy access
 DATABASE_NAME = 'people.db'
 
+# Starting data shipped with the project. It is copied to DATABASE_NAME the first
+# time the app runs and never opened itself, so running the app (which migrates
+# and writes to its database) leaves the file in git untouched.
+SEED_DATABASE_NAME = 'people_seed.db'
+
+
+class Person(NamedTuple):
+    """
+    One person's editable information - everything except the database id.
+    
+    A NamedTuple is still a plain tuple, so it can be passed straight to SQLite
+    as the statement's parameters with no conversion, and it has no per-instance
+    __dict__. Build one with keywords to avoid mixing up the order:
+        Person(first_name='John', last_name='Doe', ..., notes='')
+    """
+    first_name: str
+    last_name: str
+    email: str
+    job_title: str
+    street: str
+    street2: str
+    city: str
+    state: str
+    postal: str
+    notes: str
+
+
+# The editable columns of the people table, in Person order. The INSERT and
+# UPDATE statements below are generated from this tuple, so adding a column
+# means changing Person (plus the CREATE TABLE in create_database).
+FIELDS = Person._fields
+
+# SQL for the CRUD operations - kept as module constants so the exact same
+# string is sent every time, which lets SQLite's statement cache reuse the
+# already-parsed statement instead of re-preparing it on each call.
+_INSERT_PREFIX = f"INSERT INTO people ({', '.join(FIELDS)}) VALUES "
+_ROW_PLACEHOLDERS = f"({', '.join('?' * len(FIELDS))})"
+_ROW_LENGTH = len(FIELDS)
+
+SQL_INSERT = _INSERT_PREFIX + _ROW_PLACEHOLDERS
+
+# The list text "ID - First Last (email)" built by SQLite as each row is read,
+# so the GUI inserts it as-is instead of formatting every row in Python. Added
+# as the last column, after the normal ones, so the other columns keep their
+# positions (row[0] is still the id). Rows now have one more column, though, so
+# code that unpacks a whole row must expect it or use slices / column names.
+_DISPLAY_COLUMN = """id || ' - ' || first_name || ' ' || last_name
+           || ' (' || COALESCE(NULLIF(email, ''), 'no email') || ')' AS display"""
+
+SQL_SELECT_ALL = f'''
+    SELECT id, first_name, last_name, email,
+           {_DISPLAY_COLUMN}
+    FROM people 
+    ORDER BY last_name, first_name
+'''
+
+# Same order as SQL_SELECT_ALL but every column - ix_people_name still supplies
+# the order, so there is no sort step, just a row lookup per person
+SQL_SELECT_ALL_DETAILS = f'''
+    SELECT *,
+           {_DISPLAY_COLUMN}
+    FROM people
+    ORDER BY last_name, first_name
+'''
+
+SQL_SELECT_ONE = 'SELECT * FROM people WHERE id = ?'
+
+SQL_UPDATE = f"UPDATE people SET {', '.join(field + '=?' for field in FIELDS)} WHERE id=?"
+
+SQL_DELETE = 'DELETE FROM people WHERE id = ?'
+
+# UPDATE ... RETURNING hands back the updated row in the same statement, which
+# saves the caller a follow-up SELECT. RETURNING needs SQLite 3.35.0 or newer.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+SQL_UPDATE_RETURNING = SQL_UPDATE + ' RETURNING *'
+
+# How many rows add_people() packs into each multi-row INSERT statement
+BULK_INSERT_CHUNK = 50
+
+# How many rows get_all_people() and get_all_people_details() pull from SQLite per fetchmany() call
+FETCH_BATCH_SIZE = 500
+
+# How many people get_person_by_id() keeps cached in memory
+PERSON_CACHE_SIZE = 256
+
+# How many prepared statements the connection keeps around (default is 128)
+CACHED_STATEMENTS = 256
+
+# Stored in the database file (PRAGMA user_version) once create_database() has
+# built - or migrated to - the current schema. Version 0 is any database made
+# before versioning (AUTOINCREMENT id, no CHECK constraints). Bumping this
+# alone does nothing for existing files: create_database() also needs a
+# migration from the old version.
+SCHEMA_VERSION = 1
+
+# USPS state abbreviations (plus DC) accepted by validate_person_data
+# (https://gist.github.com/JeffPaine/3083347). Built once at import as a frozenset
+# so each membership check is a single hash lookup instead of a list scan.
+_STATE_CODES = frozenset((
+    "AK", "AL", "AR", "AZ", "CA", "CO", "CT", "DC", "DE", "FL",
+    "GA", "HI", "IA", "ID", "IL", "IN", "KS", "KY", "LA", "MA", "MD", "ME",
+    "MI", "MN", "MO", "MS", "MT", "NC", "ND", "NE", "NH", "NJ", "NM", "NV",
+    "NY", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VA",
+    "VT", "WA", "WI", "WV", "WY",
+))
+
+# Every beginning of a state code - "", "W", "WA", ... - also built once at
+# import, so is_state_prefix() is a single hash lookup per keystroke
+_STATE_PREFIXES = frozenset(code[:length] for code in _STATE_CODES for length in range(3))
+
+# The one connection shared by every function in this module.
+# It is opened lazily by _get_conn() and closed by close_database().
+_connection = None
+
+
+def _get_conn():
+    """
+    Return the shared database connection, opening it on first use.
+    
+    Opening a connection is expensive (file open, page cache setup), so we do it
+    once and reuse it for every CRUD call instead of connect/close per function.
+    check_same_thread=False lets the GUI hand work to a background thread later.
+    cached_statements sizes the per-connection prepared statement cache.
+    
+    isolation_level=None puts the connection in autocommit mode: Python's sqlite3
+    no longer sneaks a BEGIN in front of every INSERT/UPDATE/DELETE. A single
+    statement is already atomic on its own, so one-row writes simply run and
+    commit. Multi-statement work uses an explicit _transaction() instead.
+    
+    Rows come back as sqlite3.Row objects: they still unpack and index like
+    tuples, but columns can also be read by name, e.g. person['last_name'].
+    
+    Performance settings that only last as long as the connection:
+        - synchronous=NORMAL: safe with WAL, avoids an fsync on every commit
+        - temp_store=MEMORY: temporary tables/indices (e.g. sorts) stay in RAM
+        - cache_size=-64000: ~64 MB page cache (negative means KiB, not pages)
+    
+    Returns:
+        sqlite3.Connection: The module-wide connection
+    """
+    global _connection
+    
+    if _connection is None:
+        # First run: start from a copy of the shipped sample data
+        if not os.path.exists(DATABASE_NAME) and os.path.exists(SEED_DATABASE_NAME):
+            shutil.copyfile(SEED_DATABASE_NAME, DATABASE_NAME)
+        
+        _connection = sqlite3.connect(DATABASE_NAME,
+                                      check_same_thread=False,
+                                      cached_statements=CACHED_STATEMENTS,
+                                      isolation_level=None)
+        _connection.row_factory = sqlite3.Row
+        _connection.executescript('''
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-64000;
+        ''')
+    
+    return _connection
+
+
+def close_database():
+    """
+    Close the shared database connection.
+    
+    This should be called when the application shuts down.
+    It's safe to call multiple times - the next _get_conn() simply reopens.
+    """
+    global _connection
+    
+    if _connection is not None:
+        _connection.close()
+        _connection = None
+    
+    # Cached rows belong to the connection we just closed
+    get_person_by_id.cache_clear()
+
+
+@contextlib.contextmanager
+def _transaction():
+    """
+    Run the statements inside a 'with _transaction() as conn:' block as one transaction.
+    
+    BEGIN IMMEDIATE takes the write lock up front, so the transaction can't fail
+    halfway through because another connection started writing first.
+    Commits if the block finishes, rolls back if it raises.
+    
+    If the COMMIT itself fails (e.g. database busy or disk full) the transaction
+    is rolled back too. Otherwise the shared autocommit connection would stay
+    inside it, and every later one-statement write would silently join a
+    transaction that never commits.
+    """
+    conn = _get_conn()
+    conn.execute('BEGIN IMMEDIATE')
+    
+    try:
+        yield conn
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+    else:
+        try:
+            conn.execute('COMMIT')
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            raise
+
 
 def create_database():
     """
-    Initialize the database and create the people table if it doesn't exist.
+    Initialize the database: create the people table, or bring an older one up
+    to the current schema.
     
     This should be called when the application starts.
-    It's safe to call multiple times - CREATE TABLE IF NOT EXISTS won't error.
-    """
-    conn = sqlite3.connect(DATABASE_NAME)
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS people (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            first_name TEXT NOT NULL,
-            last_name TEXT NOT NULL,
-            email TEXT NOT NULL,
-            job_title TEXT NOT NULL,
-            street TEXT NOT NULL,
+    It's safe to call multiple times - once the schema is built, the database
+    file remembers it (PRAGMA user_version = SCHEMA_VERSION) and later calls
+    return after that one read, without re-running any DDL.
+    
+    A database from before versioning (user_version 0) that already has a people
+    table is migrated: the rows are copied into a new table with the current
+    definition, which then replaces the old one. State codes are trimmed and
+    upper-cased on the way; a row that still breaks a CHECK constraint makes the
+    whole migration roll back and raise sqlite3.IntegrityError, leaving the file
+    as it was.
+    
+    journal_mode=WAL (readers don't block the writer) is set here too; unlike
+    the per-connection settings in _get_conn(), it persists in the file.
+    """
+    conn = _get_conn()
+    
+    # Warm start: the schema is already there
+    if conn.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+        return
+    
+    # WAL can't be switched on inside a transaction, so do it first
+    conn.execute('PRAGMA journal_mode=WAL')
+    
+    has_people = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'people'").fetchone()
+    
+    if has_people:
+        # Rebuild the old table under the new definition, keeping every id
+        columns = ', '.join(('id',) + FIELDS)
+        copied = ', '.join('upper(trim(state))' if field == 'state' else field
+                           for field in ('id',) + FIELDS)
+        build = f'''
+            {_people_table_sql('people_new')}
+            INSERT INTO people_new ({columns}) SELECT {copied} FROM people;
+            DROP TABLE people;
+            ALTER TABLE people_new RENAME TO people;
+        '''
+    else:
+        build = _people_table_sql('people')
+    
+    # One executescript() call runs the whole script without parameter binding,
+    # wrapped in a single transaction so a failed migration changes nothing
+    try:
+        conn.executescript(f'''
+            BEGIN IMMEDIATE;
+            {build}
+            
+            -- Covering index for SQL_SELECT_ALL: rows are already stored in
+            -- (last_name, first_name) order, and id/email ride along in the index,
+            -- so the list query is an index-only scan - no sort, no table lookups
+            CREATE INDEX IF NOT EXISTS ix_people_name
+            ON people (last_name, first_name, id, email);
+            
+            PRAGMA user_version = {SCHEMA_VERSION};
+            COMMIT;
+        ''')
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute('ROLLBACK')
+        raise
+
+
+def _people_table_sql(table):
+    """
+    Return the CREATE TABLE statement for the people table (schema version 1).
+    
+    Parameters:
+        table (str): Name to create it under - 'people', or a temporary name
+                     while migrating an older table
+    """
+    # The state CHECK constraint lists the same codes validate_person_data accepts
+    state_list = ', '.join(f"'{code}'" for code in sorted(_STATE_CODES))
+    
+    return f'''
+        -- id is a plain INTEGER PRIMARY KEY (an alias for the rowid). Without
+        -- AUTOINCREMENT, SQLite skips the extra sqlite_sequence read/write on every
+        -- insert. The trade-off: new ids are max(id) + 1, so the id of the most
+        -- recently added person can be reused after that person is deleted.
+        --
+        -- The CHECK constraints repeat the business rules from validate_person_data
+        -- at the storage layer, so a code path that skips the validator can't save
+        -- a blank required field or an unknown state. The validator still runs
+        -- first to give the user a friendly message.
+        CREATE TABLE {table} (
+            id INTEGER PRIMARY KEY,
+            first_name TEXT NOT NULL CHECK (length(trim(first_name)) > 0),
+            last_name TEXT NOT NULL CHECK (length(trim(last_name)) > 0),
+            email TEXT NOT NULL CHECK (length(trim(email)) > 0),
+            job_title TEXT NOT NULL CHECK (length(trim(job_title)) > 0),
+            street TEXT NOT NULL CHECK (length(trim(street)) > 0),
             street2 TEXT,
-            city TEXT NOT NULL,
-            state TEXT NOT NULL,
-            postal TEXT NOT NULL,
+            city TEXT NOT NULL CHECK (length(trim(city)) > 0),
+            state TEXT NOT NULL CHECK (state IN ({state_list})),
+            postal TEXT NOT NULL CHECK (length(trim(postal)) > 0),
             notes TEXT
-        )
-    ''')
+        );
+    '''
+
+
+def initialize_and_load():
+    """
+    Initialize the database and return everyone in it - one call for app startup.
+    
+    Runs create_database() and get_all_people_details() back to back on the shared
+    connection, so startup is a single trip into the database layer instead of
+    two separate calls.
+    
+    Returns:
+        list of sqlite3.Row: Every person's full row, sorted by last name then first name
+    """
+    create_database()
     
-    conn.commit()
-    conn.close()
+    return list(get_all_people_details())
 
 
-def add_person(first_name, last_name, email, job_title, street, street2, city, state, postal, notes):
+def add_person(person):
     """
     Add a new person to the database.
     
     Parameters:
-        first_name (str): Person's first name (required)
-        last_name (str): Person's last name (required)
-        email (str): Person's email address (optional)
-        job_title (str): Person's job title (required)
-        street (str): Person's street address (required)
-        street2 (str): Person's suite/apartment/unit (optional)
-        city (str): Person's city (required)
-        state (str): Person's USPS state code (required)
-        postal (str): Person's postal/zip code (required)
-        notes (str): Additional notes about the person (optional)
+        person (Person): The person's information
+            first_name (str): Person's first name (required)
+            last_name (str): Person's last name (required)
+            email (str): Person's email address (required)
+            job_title (str): Person's job title (required)
+            street (str): Person's street address (required)
+            street2 (str): Person's suite/apartment/unit (optional)
+            city (str): Person's city (required)
+            state (str): Person's USPS state code (required)
+            postal (str): Person's postal/zip code (required)
+            notes (str): Additional notes about the person (optional)
     
     Returns:
         int: The ID of the newly created person
     
-    Business Rule: First and last names are required (enforced by caller)
+    Raises:
+        sqlite3.IntegrityError: If a required field is blank or the state is not
+        a valid code (CHECK constraints - databases created by this version only)
+    
+    Business Rule: Required fields are enforced by the caller (validate_person_data)
     """
-    conn = sqlite3.connect(DATABASE_NAME)
-    cursor = conn.cursor()
+    # Autocommit mode - the single INSERT commits by itself
+    cursor = _get_conn().execute(SQL_INSERT, person)
     
-    cursor.execute('''
-        INSERT INTO people (first_name, last_name, email, job_title, street, street2, city, state, postal, notes)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (first_name, last_name, email, job_title, street, street2, city, state, postal, notes))
+    # A "not found" result for this id may be cached - drop it
+    get_person_by_id.cache_clear()
     
     # Get the ID of the person we just created
-    person_id = cursor.lastrowid
+    return cursor.lastrowid
+
+
+def _bulk_insert_rows(rows, chunk=BULK_INSERT_CHUNK):
+    """
+    Insert rows using multi-row INSERT statements, 'chunk' rows per statement.
     
-    conn.commit()
-    conn.close()
+    INSERT ... VALUES (...), (...), ... inserts a whole chunk per statement
+    execution instead of one row per execution, which cuts the per-row overhead
+    of stepping a statement and crossing from Python into SQLite.
+    Leftover rows (fewer than a full chunk) use the ordinary single-row SQL_INSERT.
     
-    return person_id
+    Does not commit - the caller owns the transaction.
+    
+    Parameters:
+        rows (iterable of Person): Rows with values in FIELDS order
+        chunk (int): Number of rows per multi-row INSERT
+    
+    Returns:
+        int: The number of rows inserted
+    """
+    conn = _get_conn()
+    sql_chunk = _INSERT_PREFIX + ', '.join([_ROW_PLACEHOLDERS] * chunk)
+    
+    rows = iter(rows)
+    count = 0
+    
+    while True:
+        batch = list(itertools.islice(rows, chunk))
+        if len(batch) < chunk:
+            break
+        
+        # Flattening would silently shift values between rows if one row were
+        # too short and another too long, so check each row's length first
+        if any(len(row) != _ROW_LENGTH for row in batch):
+            raise sqlite3.ProgrammingError(f"Each row must have exactly {_ROW_LENGTH} values")
+        
+        conn.execute(sql_chunk, tuple(itertools.chain.from_iterable(batch)))
+        count += chunk
+    
+    # The tail - fewer rows than a full chunk
+    if batch:
+        conn.executemany(SQL_INSERT, batch)
+        count += len(batch)
+    
+    return count
+
+
+def add_people(rows):
+    """
+    Add many people to the database in a single transaction.
+    
+    Calling add_person() in a loop commits once per person. This inserts every
+    row in one transaction (see _bulk_insert_rows) and commits once at the end,
+    which is much faster for bulk loads (imports, seeding test data).
+    
+    Parameters:
+        rows (iterable of Person): One Person per row - any tuple with the same
+            10 values in FIELDS order also works. Any iterable works, including a
+            generator, so callers don't need to build a list first.
+    
+    Returns:
+        int: The number of people added
+    
+    If any row fails, the whole batch is rolled back - nothing is added.
+    """
+    # One explicit transaction for the whole batch - commits once on success,
+    # or rolls back if any insert fails
+    with _transaction():
+        count = _bulk_insert_rows(rows)
+    
+    get_person_by_id.cache_clear()
+    
+    return count
 
 
 def get_all_people():
     """
     Retrieve all people from the database, sorted by last name then first name.
     
-    Returns:
-        list of tuples: Each tuple contains (id, first_name, last_name, email)
-        Example: [(1, 'John', 'Doe', 'john@email.com'), (2, 'Jane', 'Smith', 'jane@email.com')]
+    Rows are streamed: SQLite hands them over FETCH_BATCH_SIZE at a time as the
+    caller loops, instead of building one big list of the whole table first.
+    The GUI can start filling the list as soon as the first rows arrive.
+    
+    Yields:
+        sqlite3.Row: (id, first_name, last_name, email, display) for each person
+        Example: (1, 'John', 'Doe', 'john@email.com', '1 - John Doe (john@email.com)')
+    
+    Usage:
+        for person_id, first, last, email, display in get_all_people(): ...
+        for person in get_all_people(): print(person['display'])
+        people = list(get_all_people())  # if you really need a list
     
     Note: We don't return 'notes' here because the list view doesn't need it.
           This keeps the data transfer efficient.
     """
-    conn = sqlite3.connect(DATABASE_NAME)
-    cursor = conn.cursor()
+    return _stream_rows(SQL_SELECT_ALL)
+
+
+def get_all_people_details():
+    """
+    Retrieve every person's complete information, sorted by last name then first name.
+    
+    Like get_all_people(), but each row has ALL columns (the same columns as
+    get_person_by_id). The GUI uses this to fill its list and keep every person
+    in memory, so opening a person needs no further query.
     
-    cursor.execute('''
-        SELECT id, first_name, last_name, email 
-        FROM people 
-        ORDER BY last_name, first_name
-    ''')
+    Yields:
+        sqlite3.Row: (id, first_name, last_name, email, job_title, street, street2,
+        city, state, postal, notes, display) for each person - display is the
+        ready-made list text "ID - First Last (email)"
+    """
+    return _stream_rows(SQL_SELECT_ALL_DETAILS)
+
+
+def _stream_rows(sql):
+    """
+    Run a SELECT and yield its rows, fetching FETCH_BATCH_SIZE at a time.
     
-    people = cursor.fetchall()
-    conn.close()
+    Parameters:
+        sql (str): The query to run
     
-    return people
+    Yields:
+        sqlite3.Row: Each result row
+    """
+    conn = _get_conn()
+    
+    cursor = conn.execute(sql)
+    cursor.arraysize = FETCH_BATCH_SIZE
+    
+    # finally runs when the loop finishes, or when the caller stops early
+    # and the generator is closed, so the cursor is never left open
+    try:
+        while True:
+            batch = cursor.fetchmany()
+            if not batch:
+                return
+            yield from batch
+    finally:
+        cursor.close()
 
 
+@functools.lru_cache(maxsize=PERSON_CACHE_SIZE)
 def get_person_by_id(person_id):
     """
     Retrieve a single person's complete information by their ID.
     
+    Results are kept in an in-memory LRU cache, so opening the same person again
+    is a dictionary hit instead of a database query. Every write function in this
+    module clears the cache. Changes made to people.db by another program are
+    not seen until the cache is cleared - fine for a single-user desktop app.
+    
     Parameters:
         person_id (int): The unique ID of the person to retrieve
     
     Returns:
-        tuple or None: (id, first_name, last_name, email, street, street2, city, state, postal, notes) if found,
+        sqlite3.Row or None: (id, first_name, last_name, email, job_title, street, street2, city, state, postal, notes) if found,
         None if not found
     
     This includes ALL fields including notes, used for detailed views and editing.
     """
-    conn = sqlite3.connect(DATABASE_NAME)
-    cursor = conn.cursor()
+    conn = _get_conn()
     
-    cursor.execute('SELECT * FROM people WHERE id = ?', (person_id,))
+    cursor = conn.execute(SQL_SELECT_ONE, (person_id,))
     person = cursor.fetchone()
     
-    conn.close()
-    
     return person
 
 
-def update_person(person_id, first_name, last_name, email, job_title, street, street2, city, state, postal, notes):
+def update_person(person_id, person):
     """
     Update an existing person's information.
     
     Parameters:
         person_id (int): The ID of the person to update
-        first_name (str): New first name
-        last_name (str): New last name
-        email (str): New email address
-        job_title (str): New job title
-        street (str): New street address
-        street2 (str): New suite/apt/unit (optional)
-        city (str): New city
-        state (str): New state
-        postal (str): New postal/zip code
-        notes (str): New notes
+        person (Person): The person's new information (all fields)
     
     Returns:
-        bool: True if the update was successful, False if person not found
+        sqlite3.Row or None: The person's updated row (same columns as
+        get_person_by_id) if the update was successful, None if person not found.
+        The row is truthy, so 'if update_person(...):' still works as a success check.
+    
+    Raises:
+        sqlite3.IntegrityError: If the new data breaks a CHECK constraint (see add_person)
     
     Business Rule: All fields are updated - this is a complete replacement,
                    not a partial update.
     """
-    conn = sqlite3.connect(DATABASE_NAME)
-    cursor = conn.cursor()
+    params = (*person, person_id)
     
-    cursor.execute('''
-        UPDATE people 
-        SET first_name=?, last_name=?, email=?, job_title=?, street=?, street2=?, city=?, state=?, postal=?, notes=?
-        WHERE id=?
-    ''', (first_name, last_name, email, job_title, street, street2, city, state, postal, notes, person_id))
+    if _HAS_RETURNING:
+        # Autocommit mode - the UPDATE commits once its results have been
+        # fetched, since the statement isn't finished until then
+        rows = _get_conn().execute(SQL_UPDATE_RETURNING, params).fetchall()
+        
+        get_person_by_id.cache_clear()
+        
+        return rows[0] if rows else None
     
-    # Check if any row was actually updated
-    rows_affected = cursor.rowcount
+    # Older SQLite: plain UPDATE, then read the row back if one was changed
+    cursor = _get_conn().execute(SQL_UPDATE, params)
+    
+    get_person_by_id.cache_clear()
     
-    conn.commit()
-    conn.close()
+    # Check if any row was actually updated
+    if cursor.rowcount == 0:
+        return None
     
-    return rows_affected > 0
+    return get_person_by_id(person_id)
 
 
 def delete_person(person_id):
@@ -189,21 +609,25 @@ def delete_person(person_id):
     
     Warning: This is permanent! The GUI should confirm before calling this.
     """
-    conn = sqlite3.connect(DATABASE_NAME)
-    cursor = conn.cursor()
+    cursor = _get_conn().execute(SQL_DELETE, (person_id,))
     
-    cursor.execute('DELETE FROM people WHERE id = ?', (person_id,))
+    get_person_by_id.cache_clear()
     
     # Check if any row was actually deleted
-    rows_affected = cursor.rowcount
-    
-    conn.commit()
-    conn.close()
+    return cursor.rowcount > 0
+
+
+def _blank(value):
+    """
+    Return True if value is missing, empty, or only whitespace.
     
-    return rows_affected > 0
+    Same result as 'not value or not value.strip()', but isspace() checks the
+    string in place instead of allocating a stripped copy just to test it.
+    """
+    return not value or value.isspace()
 
 
-def validate_person_data(first_name, last_name, email, job_title, street, city, state, postal):
+def validate_person_data(first_name, last_name, email, job_title, street, city, state, postal, street2=None, notes=None):
     """
     Validate that required fields are present.
     
@@ -214,8 +638,19 @@ def validate_person_data(first_name, last_name, email, job_title, street, city,
         job_title (str): Job title to validate
         street (str): Street address to validate
         city (str): City to validate
-        state (str): State to validate and confirm matches an abbreviation in the state_codes list
+        state (str): State to validate and confirm matches an abbreviation in _STATE_CODES
+                     exactly - the value as it will be stored (upper-case, no spaces)
         postal (str): Postal code to validate
+        street2 (str): Suite/apt/unit - optional, not validated
+        notes (str): Notes - optional, not validated
+    
+    street2 and notes are accepted so a whole form or Person can be passed in
+    as keywords: validate_person_data(**values) or validate_person_data(**person._asdict())
+    
+    The same rules are also CHECK constraints in the people table (see
+    create_database), but checking here first gives the user a readable message
+    instead of a database error - and covers databases created before the
+    constraints were added.
     
     Returns:
         tuple: (is_valid, error_message)
@@ -229,43 +664,53 @@ def validate_person_data(first_name, last_name, email, job_title, street, city,
         - Job title is required and cannot be empty/whitespace
         - Street address is required and cannot be empty/whitespace
         - City is required and cannot be empty/whitespace
-        - State is required and cannot be empty/whitespace
+        - State is required and must be an upper-case code from _STATE_CODES, exactly
+          as stored - the people table's CHECK constraint only accepts those, so
+          ' wa ' or 'wa' is rejected here rather than by the database. Callers
+          normalize first (the GUI strips and upper-cases the State field).
         - Postal code is required and cannot be empty/whitespace
         - Notes are optional (validated elsewhere if needed)
         - Street address 2 (suite/apt/unit) is optional
     """
-    # List of state abbreviations for State dropdown (https://gist.github.com/JeffPaine/3083347)
-    state_codes = ["AK", "AL", "AR", "AZ", "CA", "CO", "CT", "DC", "DE", "FL",
-               "GA", "HI", "IA", "ID", "IL", "IN", "KS", "KY", "LA", "MA", "MD", "ME",
-               "MI", "MN", "MO", "MS", "MT", "NC", "ND", "NE", "NH", "NJ", "NM", "NV",
-               "NY", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VA",
-               "VT", "WA", "WI", "WV", "WY"]
+    # Required text fields, checked in order - the first blank one is reported
+    required_fields = (
+        ("First name", first_name),
+        ("Last name", last_name),
+        ("Email", email),
+        ("Job title", job_title),
+        ("Street address", street),
+        ("City", city),
+    )
+    
+    for label, value in required_fields:
+        if _blank(value):
+            return False, f"{label} is required"
 
-    # Strip whitespace and check if empty
-    if not first_name or not first_name.strip():
-        return False, "First name is required"
-    
-    if not last_name or not last_name.strip():
-        return False, "Last name is required"
-
-    if not email or not email.strip():
-        return False, "Email is required"
-
-    if not job_title or not  job_title.strip():
-        return False, "Job title is required"
-
-    if not street or not street.strip():
-        return False, "Street address is required"
-
-    if not city or not city.strip():
-        return False, "City is required"
-
-    # Check if state is a valid US state or DC abbreviation
-    if not state or not state.strip() or state not in state_codes:
+    # Check if state is a valid US state or DC abbreviation. The value is checked
+    # exactly as it will be stored, so anything that passes here also passes the
+    # table's CHECK constraint. A blank or missing state is never in the set, so
+    # this one check covers all cases.
+    if state not in _STATE_CODES:
         return False, "Please enter a valid USPS state abbreviation"
 
-    if not postal or not postal.strip():
+    if _blank(postal):
         return False, "Please enter a postal/zip code"
     
     # All validation passed
     return True, ""
+
+
+def is_state_prefix(text):
+    """
+    Check whether text could still become a valid state abbreviation.
+    
+    Meant for checking the State field as the user types: "", "w" and "WA" pass,
+    while "X", "WAS" and "1" fail because no code in _STATE_CODES starts that way.
+    
+    Parameters:
+        text (str): What the State field would contain (case-insensitive)
+    
+    Returns:
+        bool: True if text is empty or the start of a valid code
+    """
+    return text.upper() in _STATE_PREFIXES
@@ -15,10 +15,360 @@ DEV 128 Fall 2025 Section 27802
 https://github.com/rlr524/dev-128-prog-project-2
 """
 
+import bisect
+import collections
+import concurrent.futures
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import messagebox
 import database_operations as database # Our business logic layer
 
+# Add/Edit form fields: (database field, label, entry width). The form is laid out
+# in this order, which is also the tab order - notes is a multi-line Text box.
+FORM_FIELDS = (
+    ("first_name", "First Name*:", 30),
+    ("last_name", "Last Name*:", 30),
+    ("email", "Email*:", 30),
+    ("job_title", "Job Title*:", 30),
+    ("street", "Street Address*:", 30),
+    ("street2", "Suite/Apt/Unit:", 30),
+    ("city", "City*:", 30),
+    ("state", "State*:", 3),
+    ("postal", "Postal Code*:", 30),
+    ("notes", "Notes:", 30),
+)
+
+# Text of the Read (person details) window, filled in with str.format()
+DETAIL_TMPL = """
+ID: {pid}
+First Name: {first}
+Last Name: {last}
+Email: {email}
+Job Title: {job}
+Street Address: {street}
+Street Address 2: {street2}
+City: {city}
+State: {state}
+Postal Code: {postal}
+
+Notes:
+{notes}
+"""
+
+# How often (in milliseconds) the GUI checks whether background database work has finished
+POLL_INTERVAL_MS = 10
+
+# Scrolling and resizing redraw the list at most once per this many milliseconds
+# (~60 frames per second): the first event schedules a redraw and later events
+# just ride along with it, so a continuous drag still redraws every frame
+SCROLL_THROTTLE_MS = 16
+
+
+class VirtualListbox(tk.Frame):
+    """
+    A scrollable list of text rows that only draws the rows currently on screen.
+    
+    tk.Listbox keeps every row inside Tk, so filling it with N people costs N Tk
+    calls on the main thread. This widget keeps the rows in a plain Python list and
+    draws only the visible rows (plus a few extra - the overscan) as text on a
+    Canvas. Refreshing and scrolling cost O(rows on screen) instead of O(all rows).
+    
+    It supports the parts of the Listbox interface the app uses - insert(),
+    delete(), get(), size() and itemconfig() - and tracks the clicked row in
+    selected_index.
+    """
+    
+    def __init__(self, master, font=('Arial', 14), overscan=5):
+        """
+        Build the canvas and scrollbar.
+        
+        Parameters:
+            master: The parent widget
+            font (tuple or tkfont.Font): Font used to draw the rows
+            overscan (int): Extra rows drawn below the visible area
+        """
+        super().__init__(master)
+        
+        self.font = font if isinstance(font, tkfont.Font) else tkfont.Font(font=font)
+        self.row_height = self.font.metrics('linespace') + 4
+        self.overscan = overscan
+        
+        self.items = []             # Display text for every row
+        self.item_options = []      # Per-row itemconfig() options (None = default look)
+        self.selected_index = None  # Row the user clicked on (None = nothing selected)
+        self.first_row = 0          # Row shown at the top of the viewport
+        self._render_pending = False
+        self._throttle_id = None    # Pending after() id of a throttled redraw
+        
+        # Scrollbar on the right
+        self.scrollbar = tk.Scrollbar(self, command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        
+        # Canvas the visible rows are drawn on. takefocus lets Tab reach it, so the
+        # list can be used from the keyboard like a Listbox.
+        self.canvas = tk.Canvas(self, bg='white', highlightthickness=0, takefocus=1)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        
+        # Redraw when resized, select on click or with the arrow/page keys,
+        # scroll with the mouse wheel
+        self.canvas.bind("<Configure>", lambda event: self._throttle_render())
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)  # Windows / macOS
+        self.canvas.bind("<Button-4>", lambda event: self.yview("scroll", -1, "units"))  # Linux
+        self.canvas.bind("<Button-5>", lambda event: self.yview("scroll", 1, "units"))
+        self.canvas.bind("<Up>", lambda event: self._move_selection(-1))
+        self.canvas.bind("<Down>", lambda event: self._move_selection(1))
+        self.canvas.bind("<Prior>", lambda event: self._move_selection(-self._visible_rows()))  # Page Up
+        self.canvas.bind("<Next>", lambda event: self._move_selection(self._visible_rows()))    # Page Down
+    
+    
+    # -------------------------------------------------------------------------
+    # Listbox-style interface
+    # -------------------------------------------------------------------------
+    
+    def insert(self, index, *items):
+        """Insert one or more rows before index (tk.END appends)."""
+        if index == tk.END:
+            index = len(self.items)
+        
+        self.items[index:index] = items
+        self.item_options[index:index] = [None] * len(items)
+        
+        # Keep the selection on the same row
+        if self.selected_index is not None and self.selected_index >= index:
+            self.selected_index += len(items)
+        
+        self._schedule_render()
+    
+    
+    def delete(self, first, last=None):
+        """Delete rows first through last, inclusive (just first if last is None)."""
+        if first == tk.END:
+            first = len(self.items) - 1
+        if last is None:
+            last = first
+        elif last == tk.END:
+            last = len(self.items) - 1
+        
+        if last < first:
+            return  # Nothing to delete (e.g. clearing an empty list)
+        
+        del self.items[first:last + 1]
+        del self.item_options[first:last + 1]
+        
+        # Drop the selection if its row was deleted, otherwise follow it
+        if self.selected_index is not None:
+            if first <= self.selected_index <= last:
+                self.selected_index = None
+            elif self.selected_index > last:
+                self.selected_index -= last - first + 1
+        
+        self._schedule_render()
+    
+    
+    def get(self, index):
+        """Return the text of the row at index."""
+        return self.items[index]
+    
+    
+    def size(self):
+        """Return the number of rows."""
+        return len(self.items)
+    
+    
+    def itemconfig(self, index, **options):
+        """
+        Style one row, like Listbox.itemconfig.
+        
+        Supported options: foreground and background. Only that row is redrawn,
+        and only if it is on screen - an off-screen row picks up its style the
+        next time it scrolls into view.
+        """
+        self.item_options[index] = {**(self.item_options[index] or {}), **options}
+        self._redraw_row(index)
+    
+    
+    def yview(self, *args):
+        """
+        Scroll the list - this is the scrollbar's command.
+        
+        args is ('moveto', fraction) when the thumb is dragged, or
+        ('scroll', count, 'units' or 'pages') for arrows, paging, and the wheel.
+        """
+        if args[0] == "moveto":
+            first = int(float(args[1]) * len(self.items))
+        else:
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self._visible_rows()
+            first = self.first_row + step
+        
+        self._scroll_to(first)
+    
+    
+    # -------------------------------------------------------------------------
+    # Drawing and event handling
+    # -------------------------------------------------------------------------
+    
+    def _visible_rows(self):
+        """Number of whole rows that fit in the canvas right now."""
+        return max(1, self.canvas.winfo_height() // self.row_height)
+    
+    
+    def _scroll_to(self, first):
+        """Put row 'first' at the top (clamped to the list) and redraw soon."""
+        last_possible = max(0, len(self.items) - self._visible_rows())
+        self.first_row = max(0, min(first, last_possible))
+        self._throttle_render()
+    
+    
+    def _throttle_render(self):
+        """
+        Redraw within SCROLL_THROTTLE_MS, unless a redraw is already scheduled.
+        
+        A fast mouse wheel or a thumb drag sends a burst of events. Only the
+        first one schedules a redraw; the rest just update first_row, which that
+        redraw picks up. The burst costs at most one redraw per frame, and a
+        long drag keeps redrawing (and moving the scrollbar thumb) as it goes.
+        """
+        if self._throttle_id is None:
+            self._throttle_id = self.after(SCROLL_THROTTLE_MS, self._render_viewport)
+    
+    
+    def _schedule_render(self):
+        """
+        Redraw once Tk is idle.
+        
+        Inserting or deleting many rows in a row (e.g. during a refresh) then
+        costs a single redraw instead of one per call.
+        """
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render_viewport)
+    
+    
+    def _render_viewport(self):
+        """Draw the rows from first_row down to the bottom of the canvas."""
+        self._render_pending = False
+        
+        # This draw covers any throttled redraw still waiting
+        if self._throttle_id is not None:
+            self.after_cancel(self._throttle_id)
+            self._throttle_id = None
+        
+        # Rows may have been deleted since the last draw - stay inside the list
+        last_possible = max(0, len(self.items) - self._visible_rows())
+        self.first_row = max(0, min(self.first_row, last_possible))
+        
+        # Throw away the previous drawing and draw only what is visible
+        self.canvas.delete("row")
+        width = self.canvas.winfo_width()
+        
+        for index in range(self.first_row, self._last_drawn_row()):
+            self._draw_row(index, width)
+        
+        # Size and position the scrollbar thumb
+        total = len(self.items)
+        if total:
+            self.scrollbar.set(self.first_row / total,
+                               min(1.0, (self.first_row + self._visible_rows()) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+    
+    
+    def _last_drawn_row(self):
+        """One past the last row drawn for the current first_row."""
+        return min(len(self.items), self.first_row + self._visible_rows() + self.overscan)
+    
+    
+    def _draw_row(self, index, width):
+        """
+        Draw one row's background and text.
+        
+        Each row's canvas items are tagged "row" (for a full redraw) and
+        "row<index>" (so _redraw_row can replace just that row).
+        """
+        y = (index - self.first_row) * self.row_height
+        tags = ("row", f"row{index}")
+        options = self.item_options[index] or {}
+        
+        if index == self.selected_index:
+            background = "lightblue"
+        else:
+            background = options.get("background")
+        
+        if background:
+            self.canvas.create_rectangle(0, y, width, y + self.row_height,
+                                         fill=background, outline="", tags=tags)
+        
+        self.canvas.create_text(4, y + 2, anchor="nw", text=self.items[index],
+                                fill=options.get("foreground", "black"),
+                                font=self.font, tags=tags)
+    
+    
+    def _redraw_row(self, index):
+        """Redraw a single row if it is currently drawn (does nothing otherwise)."""
+        if index is None or not self.first_row <= index < self._last_drawn_row():
+            return
+        
+        self.canvas.delete(f"row{index}")
+        self._draw_row(index, self.canvas.winfo_width())
+    
+    
+    def _on_click(self, event):
+        """Select the row under the mouse (or clear the selection below the last row)."""
+        self.canvas.focus_set()  # Windows sends mouse wheel events to the focused widget
+        
+        # Draw any scroll still waiting first, so the click hits the rows that
+        # first_row says are on screen
+        if self._throttle_id is not None:
+            self._render_viewport()
+        
+        index = self.first_row + event.y // self.row_height
+        previous = self.selected_index
+        self.selected_index = index if index < len(self.items) else None
+        
+        # Only the old and new selected rows change - redraw just those two
+        self._redraw_row(previous)
+        self._redraw_row(self.selected_index)
+    
+    
+    def _move_selection(self, step):
+        """
+        Move the selection step rows (negative = up) and scroll it into view.
+        
+        With nothing selected, the first row on screen gets selected.
+        """
+        if not self.items:
+            return "break"
+        
+        previous = self.selected_index
+        if previous is None:
+            index = self.first_row
+        else:
+            index = max(0, min(previous + step, len(self.items) - 1))
+        self.selected_index = index
+        
+        # Scroll just far enough to show the row; otherwise only two rows changed
+        visible = self._visible_rows()
+        if index < self.first_row:
+            self.first_row = index
+            self._render_viewport()
+        elif index >= self.first_row + visible:
+            self.first_row = index - visible + 1
+            self._render_viewport()
+        else:
+            self._redraw_row(previous)
+            self._redraw_row(index)
+        
+        return "break"
+    
+    
+    def _on_mousewheel(self, event):
+        """Scroll 3 rows per wheel notch (event.delta is +/-120 per notch on Windows)."""
+        notches = -event.delta // 120 if abs(event.delta) >= 120 else -event.delta
+        self.yview("scroll", notches * 3, "units")
+
 
 class CRUDApplication:
     """
@@ -39,15 +389,68 @@ class CRUDApplication:
         self.root.title("Simple CRUD Application")
         self.root.geometry("600x600")
         
-        # Initialize database - safe to call every time
-        database.create_database()
+        # One shared font for the whole app. Registering it in the option database
+        # once makes it the default for every widget - including the Add/Edit/Read
+        # windows - and every widget refers to the same named font, so Tk works out
+        # its metrics once.
+        self.font = tkfont.Font(root=self.root, family="Arial", size=14)
+        self.root.option_add("*Font", self.font)
+        
+        # Tcl command for the State box's validatecommand - registered once and
+        # shared by the Add and Edit forms. %P is the text the box would contain
+        # after the keystroke; returning False rejects the keystroke.
+        self._state_vcmd = (self.root.register(database.is_state_prefix), "%P")
+        
+        # Every person's full row, keyed by id - filled by refresh_list() and kept
+        # up to date by add/edit/delete, so Read and Edit need no database query
+        self.people_by_id = {}
+        
+        # Person ID for each list row, in the same order as the rows. Kept in
+        # lockstep with the listbox so a row index maps straight to an ID.
+        self.row_ids = []
+        
+        # Add/Edit form windows - built on first use, then hidden and reused
+        self._add_window = None
+        self._add_entries = None
+        self._add_save_button = None
+        self._edit_window = None
+        self._edit_entries = None
+        self._edit_update_button = None
+        self._edit_ctx = {}  # Who the Edit form is currently editing
+        
+        # Add form save state: "saving" while an insert is running, "reopened" if
+        # the form was hidden and opened again before that insert finished
+        self._add_ctx = {"saving": False, "reopened": False}
+        
+        # Read shows a plain message box unless "Detailed View" is ticked in the
+        # Actions menu, which uses the larger details window instead
+        self.detailed_view = tk.BooleanVar(master=self.root, value=False)
+        
+        # Read (details) window and the label showing the details - also reused
+        self._read_window = None
+        self._read_label = None
+        
+        # All database calls run on this background thread so a slow query never
+        # freezes the window. One worker keeps SQLite access strictly one-at-a-time.
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        
+        # Submitted work waiting for its result to be handed back (see run_in_background)
+        self._pending = collections.deque()
+        self._poll_scheduled = False
+        
+        # Closing the window (like Actions > Exit) finishes database work and
+        # closes the shared connection
+        self.root.protocol("WM_DELETE_WINDOW", self._shutdown)
         
         # Build the GUI components
         self.create_menu()
         self.create_main_layout()
         
-        # Load initial data
-        self.refresh_list()
+        # Initialize database (safe to call every time) and load initial data in one call
+        self.title_label.config(text="People List (Loading...)")
+        self.run_in_background(database.initialize_and_load,
+                               on_success=self.show_people,
+                               on_error=self.load_failed)
     
     
     # =========================================================================
@@ -67,6 +470,7 @@ class CRUDApplication:
                 ├── Delete Person
                 ├── (separator)
                 ├── Refresh List
+                ├── Detailed View (checkbox - Read opens the details window)
                 ├── (separator)
                 └── Exit
         """
@@ -84,8 +488,9 @@ class CRUDApplication:
         crud_menu.add_command(label="Delete Person", command=self.delete_person)
         crud_menu.add_separator()
         crud_menu.add_command(label="Refresh List", command=self.refresh_list)
+        crud_menu.add_checkbutton(label="Detailed View", variable=self.detailed_view)
         crud_menu.add_separator()
-        crud_menu.add_command(label="Exit", command=self.root.quit)
+        crud_menu.add_command(label="Exit", command=self._shutdown)
     
     
     def create_main_layout(self):
@@ -97,7 +502,7 @@ class CRUDApplication:
             │      "People List"          │
             ├─────────────────────────────┤
             │                             │
-            │      [Listbox with         │
+            │   [VirtualListbox with     │
             │       scrollbar]            │
             │                             │
             ├─────────────────────────────┤
@@ -108,26 +513,15 @@ class CRUDApplication:
         main_frame = tk.Frame(self.root)
         main_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
-        # Title label
-        tk.Label(main_frame, text="People List", 
-                font=('Arial', 14, 'bold')).pack(pady=5)
-        
-        # Listbox with scrollbar
-        listbox_frame = tk.Frame(main_frame)
-        listbox_frame.pack(fill="both", expand=True)
-        
-        # Scrollbar on the right
-        scrollbar = tk.Scrollbar(listbox_frame)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Listbox shows people - stores one person per line
-        self.listbox = tk.Listbox(listbox_frame, 
-                                  yscrollcommand=scrollbar.set, 
-                                  font=('Arial', 14))
-        self.listbox.pack(side="left", fill="both", expand=True)
+        # Title label - also shows "Loading..." while the list is being fetched
+        self.title_label = tk.Label(main_frame, text="People List", 
+                                    font=('Arial', 14, 'bold'))
+        self.title_label.pack(pady=5)
         
-        # Connect scrollbar to listbox
-        scrollbar.config(command=self.listbox.yview)
+        # Virtualized list (with its own scrollbar) shows people - one person per line.
+        # Only the rows on screen are drawn, so large tables refresh and scroll instantly.
+        self.listbox = VirtualListbox(main_frame, font=self.font)
+        self.listbox.pack(fill="both", expand=True)
         
         # Button frame at bottom
         button_frame = tk.Frame(main_frame)
@@ -152,119 +546,91 @@ class CRUDApplication:
         """
         CREATE operation - Open a form to add a new person.
         
+        The form window is built the first time and then reused: Save and Cancel
+        just hide it, and opening it again clears the fields.
+        
         Flow:
             1. Open popup window with empty form
             2. User fills in data
             3. User clicks Save
             4. Validate data (using database.validate_person_data)
             5. If valid, call database.add_person()
-            6. Refresh the list to show new person
-            7. Close popup
-        """
-        # Create popup window
-        add_window = tk.Toplevel(self.root)
-        add_window.title("Add Person")
-        add_window.geometry("600x600")
-        add_window.option_add("*Font", "Arial 14")
-        
-        # Form fields - using grid layout for alignment
-        tk.Label(add_window, text="First Name*:").grid(
-            row=0, column=0, sticky='e', padx=5, pady=5)
-        first_entry = tk.Entry(add_window, width=30)
-        first_entry.grid(row=0, column=1, padx=5, pady=5)
-        first_entry.focus()  # Cursor starts here
-        
-        tk.Label(add_window, text="Last Name*:").grid(
-            row=1, column=0, sticky='e', padx=5, pady=5)
-        last_entry = tk.Entry(add_window, width=30)
-        last_entry.grid(row=1, column=1, padx=5, pady=5)
-        
-        tk.Label(add_window, text="Email*:").grid(
-            row=2, column=0, sticky='e', padx=5, pady=5)
-        email_entry = tk.Entry(add_window, width=30)
-        email_entry.grid(row=2, column=1, padx=5, pady=5)
-
-        tk.Label(add_window, text="Job Title*:").grid(
-            row=3, column=0, sticky='e', padx=5, pady=5)
-        job_title_entry = tk.Entry(add_window, width=30)
-        job_title_entry.grid(row=3, column=1, padx=5, pady=5)
-
-        tk.Label(add_window, text="Street Address*:").grid(
-            row=4, column=0, sticky='e', padx=5, pady=5)
-        street_address_entry = tk.Entry(add_window, width=30)
-        street_address_entry.grid(row=4, column=1, padx=5, pady=5)
-
-        tk.Label(add_window, text="Suite/Apt/Unit:").grid(
-            row=5, column=0, sticky='e', padx=5, pady=5)
-        street_address_2_entry = tk.Entry(add_window, width=30)
-        street_address_2_entry.grid(row=5, column=1, padx=5, pady=5)
-
-        tk.Label(add_window, text="City*:").grid(
-            row=6, column=0, sticky='e', padx=5, pady=5)
-        city_entry = tk.Entry(add_window, width=30)
-        city_entry.grid(row=6, column=1, padx=5, pady=5)
-
-        tk.Label(add_window, text="State*:").grid(
-            row=7, column=0, sticky='e', padx=5, pady=5)
-        state_entry = tk.Entry(add_window, width=3)
-        state_entry.grid(row=7, column=1, sticky='w', padx=5, pady=5)
-
-        tk.Label(add_window, text="Postal Code*:").grid(
-            row=8, column=0, sticky='e', padx=5, pady=5)
-        postal_entry = tk.Entry(add_window, width=30)
-        postal_entry.grid(row=8, column=1, padx=5, pady=5)
-
-        # Need to move notes to last here as, weirdly, code order determines the field tab focus order, not the row attribute
-        tk.Label(add_window, text="Notes:").grid(
-            row=9, column=0, sticky='ne', padx=5, pady=5)
-        notes_text = tk.Text(add_window, width=30, height=5)
-        notes_text.grid(row=9, column=1, padx=5, pady=5)
-
-        def save_person():
-            """
-            Inner function that handles the Save button click.
-            This has access to all the entry widgets above (closure).
-            """
-            # Get values from form fields
-            first = first_entry.get().strip()
-            last = last_entry.get().strip()
-            email = email_entry.get().strip()
-            job = job_title_entry.get().strip()
-            street = street_address_entry.get().strip()
-            street2 = street_address_2_entry.get().strip()
-            city = city_entry.get().strip()
-            state = state_entry.get().strip()
-            postal = postal_entry.get().strip()
-            notes = notes_text.get("1.0", tk.END).strip()
-            
-            # Validate using business logic layer
-            is_valid, error_message = database.validate_person_data(first, last, email, job, street, city, state, postal)
-            
-            if not is_valid:
-                messagebox.showerror("Validation Error", error_message)
-                return
+            6. Insert the new person into the list in sorted order (no full refresh needed)
+            7. Hide popup
+        """
+        if self._add_window is None:
+            self._add_window, self._add_entries, self._add_save_button = self.build_person_form(
+                "Add Person", "Save", self.save_new_person)
+        else:
+            if self._add_window.state() == "withdrawn":
+                if self._add_ctx["saving"]:
+                    # Cancelled while a save is still running - leave the form
+                    # (and the disabled Save button) as is, so the same person
+                    # can't be submitted twice. person_added clears it.
+                    self._add_ctx["reopened"] = True
+                else:
+                    # Reopening after Save/Cancel - start again with an empty form.
+                    # (If the form is still open or just minimized, keep whatever
+                    # the user has typed.)
+                    self.clear_person_form(self._add_entries)
+                    self._add_save_button.config(state="normal")
             
-            # Call business logic to add person
-            person_id = database.add_person(first, last, email, job, street, street2, city, state, postal, notes)
+            # Show it again whether it was hidden or minimized
+            self._add_window.deiconify()
+        
+        self._add_window.lift()
+        self._add_entries["first_name"].focus()  # Cursor starts here
+    
+    
+    def save_new_person(self):
+        """
+        Handle the Save button click on the Add Person form.
+        """
+        # Get values from form fields, keyed by database field name
+        values = self.read_person_form(self._add_entries)
+        
+        # Validate using business logic layer
+        is_valid, error_message = database.validate_person_data(**values)
+        
+        if not is_valid:
+            messagebox.showerror("Validation Error", error_message)
+            return
+        
+        # Call business logic to add person (in the background)
+        person = database.Person(**values)
+        
+        def person_added(person_id):
+            self._add_ctx["saving"] = False
+            self.people_by_id[person_id] = (person_id, *person)
             
             # Show success message
             messagebox.showinfo("Success", 
                               f"Person added successfully!\nID: {person_id}")
             
-            # Close the popup window
-            add_window.destroy()
+            if self._add_ctx["reopened"]:
+                # The user opened Add again while this save ran - keep the window
+                # up, ready for the next person
+                self.clear_person_form(self._add_entries)
+                self._add_save_button.config(state="normal")
+            else:
+                # Hide the popup window (it's reused next time)
+                self._add_window.withdraw()
             
-            # Refresh the main list to show the new person
-            self.refresh_list()
-
-        def cancel_window():
-            add_window.destroy()
-
-        # Save button
-        tk.Button(add_window, text="Save", command=save_person, width=10).grid(row=10, column=0, pady=10)
-
-        # Cancel button
-        tk.Button(add_window, text="Cancel", command=cancel_window, width=10).grid(row=10, column=1, pady=10)
+            # Add just the new person where the database would sort them - no
+            # need to reload everyone
+            self.place_person_row(person_id)
+        
+        def add_failed(error):
+            # Keep what was typed and let the user try again
+            self._add_ctx["saving"] = False
+            self._add_save_button.config(state="normal")
+        
+        # Disable Save until the database answers so a double click can't add twice
+        self._add_ctx.update(saving=True, reopened=False)
+        self._add_save_button.config(state="disabled")
+        self.run_in_background(database.add_person, person,
+                               on_success=person_added,
+                               on_error=add_failed)
     
     
     def read_person(self):
@@ -273,26 +639,23 @@ class CRUDApplication:
         
         Flow:
             1. Get selected item from listbox
-            2. Extract person ID from selected text
-            3. Call database.get_person_by_id()
-            4. Display all fields in a popup window
+            2. Look up the person ID for the selected row in self.row_ids
+            3. Look the person up in self.people_by_id (no database query)
+            4. Display all fields in a message box, or - with "Detailed View"
+               ticked - in a larger popup window (built once, then reused)
         """
         # Check if something is selected
-        selection = self.listbox.curselection()
-        if not selection:
+        selected_index = self.listbox.selected_index
+        if selected_index is None:
             messagebox.showwarning("No Selection", 
                                  "Please select a person from the list!")
             return
         
-        # Get the selected text from listbox
-        # Format is: "ID - First Last (email)"
-        person_info = self.listbox.get(selection[0])
+        # Look up the ID stored for this row (no parsing of the display text)
+        person_id = self.row_ids[selected_index]
         
-        # Extract ID (everything before " - ")
-        person_id = int(person_info.split(" - ")[0])
-        
-        # Fetch full details from database
-        person = database.get_person_by_id(person_id)
+        # Full details were loaded by refresh_list - no database query needed
+        person = self.people_by_id.get(person_id)
         
         if not person:
             messagebox.showerror("Error", "Person not found in database!")
@@ -300,185 +663,153 @@ class CRUDApplication:
         
         # Unpack tuple for readability
         # person = (id, first_name, last_name, email, notes)
-        pid, first, last, email, job, street, street2, city, state, postal, notes = person
-        
-        # Create display window
-        read_window = tk.Toplevel(self.root)
-        read_window.title("Person Details")
-        read_window.geometry("800x600")
-        read_window.option_add("*Font", "Arial 14")
+        pid, first, last, email, job, street, street2, city, state, postal, notes = person[:len(database.FIELDS) + 1]
         
         # Format details nicely
-        details = f"""
-ID: {pid}
-First Name: {first}
-Last Name: {last}
-Email: {email}
-Job Title: {job}
-Street Address: {street}
-Street Address 2: {street2 if street2 else '(not provided)'}
-City: {city}
-State: {state}
-Postal Code: {postal}
-
-Notes:
-{notes if notes else '(no notes)'}
-        """
+        details = DETAIL_TMPL.format(pid=pid, first=first, last=last, email=email,
+                                     job=job, street=street,
+                                     street2=street2 or "(not provided)",
+                                     city=city, state=state, postal=postal,
+                                     notes=notes or "(no notes)")
+        
+        # A standard message box needs no widgets of our own
+        if not self.detailed_view.get():
+            messagebox.showinfo("Person Details", details.strip(), parent=self.root)
+            return
         
-        # Display as label
-        tk.Label(read_window, text=details, wraplength=400,
-                justify='left', font=('Arial', 12)).pack(padx=20, pady=20)
+        # Create display window the first time; after that just show it again
+        if self._read_window is None:
+            read_window = tk.Toplevel(self.root)
+            read_window.title("Person Details")
+            read_window.geometry("800x600")
+            read_window.protocol("WM_DELETE_WINDOW", read_window.withdraw)
+            
+            # Display as label
+            self._read_label = tk.Label(read_window, wraplength=400,
+                                        justify='left', font=('Arial', 12))
+            self._read_label.pack(padx=20, pady=20)
+            
+            # Close button
+            tk.Button(read_window, text="Close", 
+                     command=read_window.withdraw).pack(pady=10)
+            
+            self._read_window = read_window
+        else:
+            self._read_window.deiconify()
         
-        # Close button
-        tk.Button(read_window, text="Close", 
-                 command=read_window.destroy).pack(pady=10)
+        self._read_label.config(text=details)
+        self._read_window.lift()
     
     
     def edit_person(self):
         """
         UPDATE operation - Edit selected person's information.
         
+        Like the Add form, the Edit form window is built once and reused.
+        
         Flow:
             1. Get selected person from listbox
-            2. Call database.get_person_by_id() to get current data
+            2. Look up current data in self.people_by_id
             3. Open form pre-filled with current values
             4. User modifies data
             5. User clicks Update
             6. Validate data
             7. If valid, call database.update_person()
-            8. Refresh list to show updated info
-            9. Close popup
+            8. Replace just the edited row in the list
+            9. Hide popup
         """
         # Check if something is selected
-        selection = self.listbox.curselection()
-        if not selection:
+        selected_index = self.listbox.selected_index
+        if selected_index is None:
             messagebox.showwarning("No Selection", 
                                  "Please select a person to edit!")
             return
         
         # Get person ID
-        person_info = self.listbox.get(selection[0])
-        person_id = int(person_info.split(" - ")[0])
+        person_id = self.row_ids[selected_index]
         
-        # Fetch current data
-        person = database.get_person_by_id(person_id)
+        # Current data was loaded by refresh_list - no database query needed
+        person = self.people_by_id.get(person_id)
         
         if not person:
             messagebox.showerror("Error", "Person not found in database!")
             return
         
-        # Unpack current values
-        pid, first, last, email, job, street, street2, city, state, postal, notes = person
-        
-        # Create edit window
-        edit_window = tk.Toplevel(self.root)
-        edit_window.title("Edit Person")
-        edit_window.geometry("600x600")
-        edit_window.option_add("*Font", "Arial 14")
-        
-        # Form fields pre-filled with current data
-        tk.Label(edit_window, text="First Name*:").grid(
-            row=0, column=0, sticky='e', padx=5, pady=5)
-        first_edit = tk.Entry(edit_window, width=30)
-        first_edit.insert(0, first)  # Pre-fill with current value
-        first_edit.grid(row=0, column=1, padx=5, pady=5)
-        
-        tk.Label(edit_window, text="Last Name*:").grid(
-            row=1, column=0, sticky='e', padx=5, pady=5)
-        last_edit = tk.Entry(edit_window, width=30)
-        last_edit.insert(0, last)
-        last_edit.grid(row=1, column=1, padx=5, pady=5)
-        
-        tk.Label(edit_window, text="Email*:").grid(
-            row=2, column=0, sticky='e', padx=5, pady=5)
-        email_edit = tk.Entry(edit_window, width=30)
-        email_edit.insert(0, email)
-        email_edit.grid(row=2, column=1, padx=5, pady=5)
-
-        tk.Label(edit_window, text="Job Title*:").grid(
-            row=3, column=0, sticky='e', padx=5, pady=5)
-        job_edit = tk.Entry(edit_window, width=30)
-        job_edit.insert(0, job)
-        job_edit.grid(row=3, column=1, padx=5, pady=5)
-
-        tk.Label(edit_window, text="Street Address*:").grid(
-            row=4, column=0, sticky='e', padx=5, pady=5)
-        street_edit = tk.Entry(edit_window, width=30)
-        street_edit.insert(0, street)
-        street_edit.grid(row=4, column=1, padx=5, pady=5)
-
-        tk.Label(edit_window, text="Suite/Apt/Unit:").grid(
-            row=5, column=0, sticky='e', padx=5, pady=5)
-        street_2_edit = tk.Entry(edit_window, width=30)
-        street_2_edit.insert(0, street2)
-        street_2_edit.grid(row=5, column=1, padx=5, pady=5)
-
-        tk.Label(edit_window, text="City*:").grid(
-            row=6, column=0, sticky='e', padx=5, pady=5)
-        city_edit = tk.Entry(edit_window, width=30)
-        city_edit.insert(0, city)
-        city_edit.grid(row=6, column=1, padx=5, pady=5)
-
-        tk.Label(edit_window, text="State*:").grid(
-            row=7, column=0, sticky='e', padx=5, pady=5)
-        state_edit = tk.Entry(edit_window, width=30)
-        state_edit.insert(0, state)
-        state_edit.grid(row=7, column=1, sticky='w', padx=5, pady=5)
-
-        tk.Label(edit_window, text="Postal Code*:").grid(
-            row=8, column=0, sticky='e', padx=5, pady=5)
-        postal_edit = tk.Entry(edit_window, width=30)
-        postal_edit.insert(0, postal)
-        postal_edit.grid(row=8, column=1, padx=5, pady=5)
-
-        tk.Label(edit_window, text="Notes:").grid(
-            row=9, column=0, sticky='ne', padx=5, pady=5)
-        notes_text_edit = tk.Text(edit_window, width=30, height=5)
-        notes_text_edit.insert("1.0", notes if notes else "")
-        notes_text_edit.grid(row=9, column=1, padx=5, pady=5)
-        
-        def update_person():
-            """
-            Function that handles the Update button click.
-            """
-            # Get modified values (recall that strip will remove any leading or ending spaces)
-            first_e = first_edit.get().strip()
-            last_e = last_edit.get().strip()
-            email_e = email_edit.get().strip()
-            job_e = job_edit.get().strip()
-            street_e = street_edit.get().strip()
-            street_2_e = street_2_edit.get().strip()
-            city_e = city_edit.get().strip()
-            state_e = state_edit.get().strip()
-            postal_e = postal_edit.get().strip()
-            notes_e = notes_text_edit.get("1.0", tk.END).strip() # from the starting position of line 1 character 0 to the end of all text
-            
-            # Validate all required fields
-            is_valid, error_message = database.validate_person_data(first_e, last_e, email_e, job_e, street_e, city_e, state_e, postal_e)
+        if self._edit_window is None:
+            self._edit_window, self._edit_entries, self._edit_update_button = self.build_person_form(
+                "Edit Person", "Update", self.save_edited_person)
+        else:
+            self._edit_window.deiconify()
+            self._edit_window.lift()
+        
+        # Remember who is being edited - save_edited_person reads this
+        self._edit_ctx["person_id"] = person_id
+        
+        # Pre-fill the form with current values (person[0] is the id)
+        self.clear_person_form(self._edit_entries)
+        for field, value in zip(database.FIELDS, person[1:]):
+            widget = self._edit_entries[field]
+            if isinstance(widget, tk.Text):
+                widget.insert("1.0", value if value else "")
+            else:
+                widget.insert(0, value if value else "")
+        
+        self._edit_update_button.config(state="normal")
+        self._edit_entries["first_name"].focus()
+    
+    
+    def save_edited_person(self):
+        """
+        Handle the Update button click on the Edit Person form.
+        """
+        person_id = self._edit_ctx["person_id"]
+        
+        # Get modified values, keyed by database field name
+        values = self.read_person_form(self._edit_entries)
+        
+        # Validate all required fields
+        is_valid, error_message = database.validate_person_data(**values)
 
-            if not is_valid:
-                messagebox.showerror("Validation Error", error_message)
-                return
-            
-            # Call business logic to update database file
-            success = database.update_person(person_id, first_e, last_e, email_e, job_e, street_e, street_2_e, city_e, state_e, postal_e, notes_e)
-            
+        if not is_valid:
+            messagebox.showerror("Validation Error", error_message)
+            return
+        
+        # Call business logic to update database file (in the background)
+        person = database.Person(**values)
+        update_button = self._edit_update_button
+        
+        def person_updated(success):
             if success:
+                self.people_by_id[person_id] = (person_id, *person)
                 messagebox.showinfo("Success", "Person updated successfully!")
-                edit_window.destroy() # kill the window
-                self.refresh_list() # refresh the list of people in our main frame
+                
+                # Hide the window (it's reused next time) - unless it has been
+                # reopened for someone else while this update was running
+                if self._edit_ctx.get("person_id") == person_id:
+                    self._edit_window.withdraw()
+                
+                # Replace only this person's row rather than reloading the whole list.
+                # The edit window isn't modal, so rows may have moved since it opened -
+                # find the person's current row by ID. A changed name can move the
+                # row, so it goes back in at its sorted position.
+                if person_id in self.row_ids:
+                    row_index = self.row_ids.index(person_id)
+                    was_selected = self.listbox.selected_index == row_index
+                    self.listbox.delete(row_index)
+                    del self.row_ids[row_index]
+                    
+                    new_index = self.place_person_row(person_id)
+                    if was_selected:
+                        self.listbox.selected_index = new_index
             else:
                 messagebox.showerror("Error", "Failed to update person!")
-
-        def cancel_window():
-            edit_window.destroy()
+                update_button.config(state="normal")
         
-        # Update button
-        tk.Button(edit_window, text="Update", 
-                 command=update_person, width=15).grid(row=10, column=0, pady=10)
-
-        # Cancel button
-        tk.Button(edit_window, text="Cancel", command=cancel_window, width=10).grid(row=10, column=1, pady=10)
+        # Disable Update until the database answers so a double click can't save twice
+        update_button.config(state="disabled")
+        self.run_in_background(database.update_person, person_id, person,
+                               on_success=person_updated,
+                               on_error=lambda error: update_button.config(state="normal"))
     
     
     def delete_person(self):
@@ -489,20 +820,20 @@ Notes:
             1. Get selected person from listbox
             2. Show confirmation dialog (important for destructive actions!)
             3. If confirmed, call database.delete_person()
-            4. Refresh list to remove deleted person
+            4. Remove just that row from the list
         
         Safety: Always confirm before delete operations!
         """
         # Check if something is selected
-        selection = self.listbox.curselection()
-        if not selection:
+        selected_index = self.listbox.selected_index
+        if selected_index is None:
             messagebox.showwarning("No Selection", 
                                  "Please select a person to delete!")
             return
         
         # Get person info for confirmation message
-        person_info = self.listbox.get(selection[0])
-        person_id = int(person_info.split(" - ")[0])
+        person_info = self.listbox.get(selected_index)
+        person_id = self.row_ids[selected_index]
         
         # Confirm deletion - CRITICAL for destructive operations
         confirm = messagebox.askyesno(
@@ -513,14 +844,116 @@ Notes:
         if not confirm:
             return  # User clicked "No" - abort deletion
         
-        # Call business logic to delete
-        success = database.delete_person(person_id)
+        def person_deleted(success):
+            if success:
+                self.people_by_id.pop(person_id, None)
+                messagebox.showinfo("Success", "Person deleted successfully!")
+                
+                # Find the row by ID - the list may have changed while the delete ran
+                if person_id in self.row_ids:
+                    row_index = self.row_ids.index(person_id)
+                    self.listbox.delete(row_index)
+                    del self.row_ids[row_index]
+            else:
+                messagebox.showerror("Error", "Failed to delete person!")
         
-        if success:
-            messagebox.showinfo("Success", "Person deleted successfully!")
-            self.refresh_list()
-        else:
-            messagebox.showerror("Error", "Failed to delete person!")
+        # Call business logic to delete (in the background)
+        self.run_in_background(database.delete_person, person_id, on_success=person_deleted)
+    
+    
+    # =========================================================================
+    # FORM METHODS - The Add/Edit person form, built once and reused
+    # =========================================================================
+    
+    def build_person_form(self, title, submit_text, submit_command):
+        """
+        Create a hidden-on-close popup window holding the person form.
+        
+        Building ~25 widgets is the slow part of opening a form, so each form
+        window is built once and then hidden (withdraw) instead of destroyed.
+        
+        Parameters:
+            title (str): Window title
+            submit_text (str): Text for the submit button ("Save" or "Update")
+            submit_command: Called when the submit button is clicked
+        
+        Returns:
+            tuple: (window, entries, submit_button) where entries maps each
+                   database.FIELDS name to its Entry (or Text, for notes) widget
+        """
+        window = tk.Toplevel(self.root)
+        window.title(title)
+        window.geometry("600x600")
+        
+        # Closing the window with the title bar X hides it too
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
+        
+        # Form fields - using grid layout for alignment. Note that, weirdly, code
+        # order determines the field tab focus order, not the row attribute, so
+        # FORM_FIELDS lists notes last.
+        entries = {}
+        for row, (field, label, width) in enumerate(FORM_FIELDS):
+            if field == "notes":
+                tk.Label(window, text=label).grid(
+                    row=row, column=0, sticky='ne', padx=5, pady=5)
+                widget = tk.Text(window, width=30, height=5)
+                widget.grid(row=row, column=1, padx=5, pady=5)
+            else:
+                tk.Label(window, text=label).grid(
+                    row=row, column=0, sticky='e', padx=5, pady=5)
+                if field == "state":
+                    # Only accept keystrokes that can still make a valid state code
+                    widget = tk.Entry(window, width=width, validate="key",
+                                      validatecommand=self._state_vcmd)
+                else:
+                    widget = tk.Entry(window, width=width)
+                widget.grid(row=row, column=1, sticky='w' if width < 30 else '', padx=5, pady=5)
+            entries[field] = widget
+        
+        button_row = len(FORM_FIELDS)
+        
+        # Submit (Save/Update) button
+        submit_button = tk.Button(window, text=submit_text, command=submit_command, width=10)
+        submit_button.grid(row=button_row, column=0, pady=10)
+        
+        # Cancel button
+        tk.Button(window, text="Cancel", command=window.withdraw, width=10).grid(row=button_row, column=1, pady=10)
+        
+        return window, entries, submit_button
+    
+    
+    @staticmethod
+    def read_person_form(entries):
+        """
+        Read every field of a person form in one pass.
+        
+        Parameters:
+            entries (dict): Field name -> Entry/Text widget (from build_person_form)
+        
+        Returns:
+            dict: Field name -> value with leading/trailing spaces stripped,
+                  ready for database.Person(**values)
+        """
+        values = {
+            # A Text widget is read from line 1, character 0 to the end of all text
+            field: (widget.get("1.0", tk.END) if isinstance(widget, tk.Text) else widget.get()).strip()
+            for field, widget in entries.items()
+        }
+        
+        # State codes are stored upper-case
+        values["state"] = values["state"].upper()
+        
+        return values
+    
+    
+    @staticmethod
+    def clear_person_form(entries):
+        """Empty every field of a person form."""
+        for widget in entries.values():
+            if isinstance(widget, tk.Text):
+                widget.delete("1.0", tk.END)
+            else:
+                widget.delete(0, tk.END)
     
     
     # =========================================================================
@@ -531,35 +964,169 @@ Notes:
         """
         Refresh the listbox with current database contents.
         
-        This is called after any operation that changes the data:
-        - After adding a person
-        - After editing a person
-        - After deleting a person
-        - When the application first starts
-        - When user clicks "Refresh List" menu item
+        This reloads everyone, so it is only called when the user clicks the
+        "Refresh List" menu item (startup loads the list via initialize_and_load).
+        Add, edit, and delete update just the affected row instead.
+        
+        Flow:
+            1. Show "Loading..." in the title
+            2. Call database.get_all_people_details() in the background
+            3. When the rows arrive, show_people() clears and refills the listbox
+        """
+        self.title_label.config(text="People List (Loading...)")
+        
+        # Get all people (every column) from database. The rows are collected into
+        # a list on the worker thread so the main thread never touches SQLite.
+        self.run_in_background(lambda: list(database.get_all_people_details()),
+                               on_success=self.show_people,
+                               on_error=self.load_failed)
+    
+    
+    def load_failed(self, error):
+        """
+        Clear "Loading..." from the title when loading the list failed.
+        
+        The error itself has already been shown by _poll_background; the list
+        keeps whatever it showed before, and Refresh List can try again.
+        """
+        self.title_label.config(text="People List")
+    
+    
+    def show_people(self, people):
+        """
+        Replace the listbox contents with the given people.
+        
+        Parameters:
+            people (list of rows): Full rows from database.get_all_people_details()
         
         Flow:
             1. Clear current listbox contents
-            2. Call database.get_all_people()
-            3. Format each person as "ID - First Last (email)"
-            4. Insert into listbox
+            2. Remember each person's full row in self.people_by_id
+            3. Insert every person's "ID - First Last (email)" text into listbox
+               in one call (the text comes ready-made from the query's display column)
         """
         # Clear existing items
         self.listbox.delete(0, tk.END)
+        self.row_ids.clear()
+        self.people_by_id.clear()
         
-        # Get all people from database
-        people = database.get_all_people()
+        # person is a row: (id, first_name, last_name, email, job_title, ..., notes, display)
+        people = list(people)
+        self.people_by_id.update((person["id"], person) for person in people)
+        self.row_ids.extend(person["id"] for person in people)
         
-        # Add each person to listbox
-        for person in people:
-            # person is a tuple: (id, first_name, last_name, email)
-            person_id, first, last, email = person
-            
-            # Format for display
-            display_text = f"{person_id} - {first} {last} ({email if email else 'no email'})"
-            
-            # Insert into listbox
-            self.listbox.insert(tk.END, display_text)
+        # Insert all the display texts at once - one insert (and one redraw)
+        # instead of one per person
+        self.listbox.insert(tk.END, *[person["display"] for person in people])
+        
+        self.title_label.config(text="People List")
+    
+    
+    def place_person_row(self, person_id):
+        """
+        Insert a person's row into the list at their sorted position.
+        
+        The list is in the same order as the database query (last name, then
+        first name, then ID), so a binary search over row_ids finds the spot
+        without reloading or re-sorting anything.
+        
+        Parameters:
+            person_id (int): A person already stored in self.people_by_id
+        
+        Returns:
+            int: The index the row was inserted at
+        """
+        person = self.people_by_id[person_id]
+        row_index = bisect.bisect(self.row_ids, self.sort_key(person_id), key=self.sort_key)
+        
+        self.listbox.insert(row_index, self.format_person(person_id, person[1], person[2], person[3]))
+        self.row_ids.insert(row_index, person_id)
+        
+        return row_index
+    
+    
+    def sort_key(self, person_id):
+        """List order for a person: (last name, first name, ID), as in ORDER BY last_name, first_name."""
+        person = self.people_by_id[person_id]
+        return (person[2], person[1], person_id)
+    
+    
+    def run_in_background(self, func, *args, on_success=None, on_error=None):
+        """
+        Run func(*args) on the database worker thread without blocking the GUI.
+        
+        Tk widgets may only be touched from the main thread, so the worker never
+        calls back into Tk itself. Instead the main thread checks every
+        POLL_INTERVAL_MS for finished work and calls the callbacks there, in the
+        same order the work was submitted.
+        
+        Parameters:
+            func: The function to run (normally a database.* function)
+            *args: Arguments passed to func
+            on_success: Called with func's return value when it finishes
+            on_error: Called with the exception if func raised (after an error
+                      message has been shown to the user)
+        """
+        future = self.executor.submit(func, *args)
+        self._pending.append((future, on_success, on_error))
+        
+        if not self._poll_scheduled:
+            self._poll_scheduled = True
+            self.root.after(POLL_INTERVAL_MS, self._poll_background)
+    
+    
+    def _poll_background(self):
+        """Hand results of finished background work to their callbacks, oldest first."""
+        self._poll_scheduled = False
+        
+        try:
+            # The single worker finishes jobs in order, so only the oldest can be next
+            while self._pending and self._pending[0][0].done():
+                future, on_success, on_error = self._pending.popleft()
+                error = future.exception()
+                
+                if error is not None:
+                    messagebox.showerror("Database Error", str(error))
+                    if on_error:
+                        on_error(error)
+                elif on_success:
+                    on_success(future.result())
+        finally:
+            # Keep checking while work is still in flight - even if a callback
+            # raised, so the remaining results still get delivered
+            if self._pending and not self._poll_scheduled:
+                self._poll_scheduled = True
+                self.root.after(POLL_INTERVAL_MS, self._poll_background)
+    
+    
+    def _shutdown(self):
+        """
+        Close the application cleanly - used by both Actions > Exit and the
+        window's close button.
+        
+        Unlike root.quit(), which only stops mainloop, this lets pending database
+        writes finish and tears down the Tk window.
+        
+        Flow:
+            1. Wait for any database work still running on the worker thread
+            2. Close the shared database connection (database.close_database)
+            3. Destroy the main window, which ends mainloop
+        """
+        self.executor.shutdown(wait=True)
+        database.close_database()
+        self.root.destroy()
+    
+    
+    @staticmethod
+    def format_person(person_id, first, last, email):
+        """
+        Build the text shown for one person in the list.
+        
+        Format is: "ID - First Last (email)" - the same text as the display
+        column of database.get_all_people_details(), for rows added or edited
+        since the list was loaded.
+        """
+        return f"{person_id} - {first} {last} ({email if email else 'no email'})"
 
 
 # =============================================================================